@@ -151,10 +151,7 @@ class BuildBackgroundWorker(BackendBackgroundWorker):
         """
         Create backup directory and move there results from previous build.
         """
-        try:
-            os.makedirs(job.results_dir)
-        except FileExistsError:
-            pass
+        os.makedirs(job.results_dir, exist_ok=True)
 
         if not os.listdir(job.results_dir):
             return
@@ -164,8 +161,7 @@ class BuildBackgroundWorker(BackendBackgroundWorker):
         self.log.info("Cleaning target directory, results from previous build storing in %s",
                       backup_dir)
 
-        if not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
+        os.makedirs(backup_dir, exist_ok=True)
 
         files = (x for x in os.listdir(job.results_dir) if x != backup_dir_name)
         for filename in files:
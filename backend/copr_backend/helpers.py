@@ -601,11 +601,10 @@ def get_backend_opts():
 
 
 def ensure_dir_exists(path, log):
-    if not os.path.isdir(path):
-        try:
-            os.makedirs(path)
-        except OSError as e:
-            log.exception(str(e))
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError as e:
+        log.exception(str(e))
 
 
 def get_chroot_arch(chroot):
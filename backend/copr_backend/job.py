@@ -114,7 +114,7 @@ class BuildJob(object):
 
     @property
     def chroot_dir(self):
-        return os.path.normpath("{}/{}".format(self.destdir, self.chroot))
+        return os.path.normpath(os.path.join(self.destdir, self.chroot))
 
     @property
     def results_dir(self):
@@ -10,29 +10,50 @@ import logging
 import shutil
 import pprint
 import shlex
-import pkg_resources
 
 try:
     from simplejson.scanner import JSONDecodeError
 except ImportError:
     JSONDecodeError = Exception
 
-from copr_common.request import SafeRequest
-from copr_rpmbuild import providers
-from copr_rpmbuild.builders.mock import MockBuilder
-from copr_rpmbuild.automation import run_automation_tools
 from copr_rpmbuild.helpers import read_config, \
      parse_copr_name, dump_live_log, copr_chroot_to_task_id, macros_for_task
 from six.moves.urllib.parse import urlparse, urljoin, urlencode
 
+# The providers, builders and python-requests (SafeRequest) are imported
+# lazily by the functions which need them, so 'copr-rpmbuild --help' and the
+# --detached fork don't pay for loading them.
+
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 log.addHandler(logging.StreamHandler(sys.stdout))
 
-try:
-    VERSION = pkg_resources.require('copr-rpmbuild')[0].version
-except pkg_resources.DistributionNotFound:
-    VERSION = 'git'
+
+def get_version():
+    """
+    Return the installed copr-rpmbuild version, or 'git' when running from
+    a git checkout.  Prefer importlib.metadata, as pkg_resources is slow to
+    import (it scans all the installed distributions).
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        # Python < 3.8
+        import pkg_resources
+        try:
+            return pkg_resources.require('copr-rpmbuild')[0].version
+        except pkg_resources.DistributionNotFound:
+            return 'git'
+
+    try:
+        return version('copr-rpmbuild')
+    except PackageNotFoundError:
+        return 'git'
+
+
+VERSION = get_version()
+
 
 def daemonize():
     try:
@@ -157,6 +178,9 @@ def produce_srpm(task, config):
     """
     Use *Provider() classes to create source RPM in config.get("resultdir")
     """
+    # pylint: disable=import-outside-toplevel
+    from copr_rpmbuild import providers
+
     try:
         macros = macros_for_task(task, config)
         clazz = providers.factory(task["source_type"])
@@ -182,8 +206,11 @@ def get_task(args, config, build_config_url_path=None, task_id=None):
         url = urljoin(config.get("main", "frontend_url"), build_config_url_path)
         task.update(get_vanilla_build_config(url))
 
-    if task.get("source_json"):
-        task["source_json"] = json.loads(task["source_json"])
+    # Frontend sends source_json as a JSON-encoded string, while the locally
+    # prepared --task-file may already have it inlined as an object.
+    source_json = task.get("source_json")
+    if source_json and isinstance(source_json, str):
+        task["source_json"] = json.loads(source_json)
 
     if args.chroot:
         task['chroot'] = args.chroot
@@ -195,8 +222,16 @@ def get_task(args, config, build_config_url_path=None, task_id=None):
 
 
 def log_task(task):
-    pp = pprint.PrettyPrinter(width=120)
-    log.info("Task:\n"+pp.pformat(task)+'\n')
+    """
+    Print the task summary, or the full task dump in --verbose mode (which
+    copr-backend uses).  The dump can be large (source_json, repos, ...) so we
+    don't format it by default.
+    """
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Task:\n%s", pprint.pformat(task, width=120))
+        return
+    log.info("Task: id=%s, chroot=%s, source_type=%s", task.get("task_id"),
+             task.get("chroot"), task.get("source_type"))
 
 
 def build_srpm(args, config):
@@ -224,6 +259,11 @@ def build_srpm(args, config):
 
 
 def build_rpm(args, config):
+    # pylint: disable=import-outside-toplevel
+    from copr_rpmbuild import providers
+    from copr_rpmbuild.builders.mock import MockBuilder
+    from copr_rpmbuild.automation import run_automation_tools
+
     if not args.chroot:
         raise RuntimeError("Missing --chroot parameter")
 
@@ -268,6 +308,9 @@ def build_rpm(args, config):
 
 
 def dump_configs(args, config):
+    # pylint: disable=import-outside-toplevel
+    from copr_rpmbuild.builders.mock import MockBuilder
+
     if not args.chroot:
         raise RuntimeError("Missing --chroot parameter")
 
@@ -300,6 +343,9 @@ def dump_configs(args, config):
 
 
 def get_vanilla_build_config(url):
+    # pylint: disable=import-outside-toplevel
+    from copr_common.request import SafeRequest
+
     try:
         request = SafeRequest(log=log)
         response = request.get(url)
@@ -315,7 +361,7 @@ def get_vanilla_build_config(url):
 def read_task_from_file(path):
     try:
         with open(path, "r") as f:
-            return json.loads(f.read())
+            return json.load(f)
     except OSError as ex:
         raise RuntimeError(ex)
     except json.decoder.JSONDecodeError:
@@ -1,10 +1,15 @@
 import os
+import json
+import logging
+import pprint
+import sys
+from argparse import Namespace
 
 import pytest
 
 from copr_common.enums import BuildSourceEnum
 
-from main import produce_srpm
+from main import produce_srpm, get_version, get_task, log_task
 
 from . import TestCase
 
@@ -69,3 +74,87 @@ class TestTmpCleanup(TestCase):
         # root + resultdir + workspace (cleaned workdir)
         directories = list(os.walk(self.workdir))
         assert len(directories) == 3
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8),
+                    reason="importlib.metadata is new in Python 3.8")
+def test_get_version_not_installed():
+    from importlib.metadata import PackageNotFoundError
+    # running from git checkout, copr-rpmbuild is not installed
+    with mock.patch("importlib.metadata.version") as mc_version:
+        mc_version.side_effect = PackageNotFoundError("copr-rpmbuild")
+        assert get_version() == "git"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8),
+                    reason="importlib.metadata is new in Python 3.8")
+@mock.patch("importlib.metadata.version")
+def test_get_version(mc_version):
+    mc_version.return_value = "0.70"
+    assert get_version() == "0.70"
+    mc_version.assert_called_once_with("copr-rpmbuild")
+
+
+class _DistributionNotFound(Exception):
+    pass
+
+
+@pytest.mark.parametrize("installed", [True, False])
+def test_get_version_pkg_resources(installed):
+    # Python < 3.8, no importlib.metadata
+    pkg_resources = mock.MagicMock()
+    pkg_resources.DistributionNotFound = _DistributionNotFound
+    if installed:
+        pkg_resources.require.return_value = [mock.MagicMock(version="0.70")]
+    else:
+        pkg_resources.require.side_effect = _DistributionNotFound
+    modules = {"importlib.metadata": None, "pkg_resources": pkg_resources}
+    with mock.patch.dict(sys.modules, modules):
+        assert get_version() == ("0.70" if installed else "git")
+    pkg_resources.require.assert_called_once_with("copr-rpmbuild")
+
+
+LOGGED_TASK = {
+    "task_id": "123-fedora-rawhide-x86_64",
+    "chroot": "fedora-rawhide-x86_64",
+    "source_type": BuildSourceEnum.scm,
+    "source_json": {"clone_url": "https://example.com/foo.git"},
+}
+
+
+def test_log_task_info(caplog):
+    caplog.set_level(logging.INFO, logger="main")
+    log_task(LOGGED_TASK)
+    assert caplog.messages == [
+        "Task: id=123-fedora-rawhide-x86_64, chroot=fedora-rawhide-x86_64, "
+        "source_type={}".format(BuildSourceEnum.scm),
+    ]
+
+
+def test_log_task_debug(caplog):
+    caplog.set_level(logging.DEBUG, logger="main")
+    log_task(LOGGED_TASK)
+    assert caplog.messages == [
+        "Task:\n" + pprint.pformat(LOGGED_TASK, width=120),
+    ]
+
+
+@pytest.mark.parametrize("source_json,expected", [
+    # as sent by frontend
+    ('{"clone_url": "https://example.com/foo.git"}',
+     {"clone_url": "https://example.com/foo.git"}),
+    # already inlined in a locally prepared task file
+    ({"clone_url": "https://example.com/foo.git"},
+     {"clone_url": "https://example.com/foo.git"}),
+    ("", ""),
+])
+def test_get_task_file_source_json(source_json, expected, tmp_path):
+    task_file = tmp_path / "task.json"
+    task_file.write_text(json.dumps({
+        "source_type": BuildSourceEnum.scm,
+        "source_json": source_json,
+    }))
+    args = Namespace(task_file=str(task_file), task_url=None, chroot=None,
+                     copr=None)
+    task = get_task(args, config=None)
+    assert task["source_json"] == expected